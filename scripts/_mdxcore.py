@@ -0,0 +1,317 @@
+"""Per-line hot loop of fix_mdx.py, isolated for native compilation.
+
+Everything here is pure string dispatch over every line of every
+markdown file — the interpreter-bound part of the pipeline. The module
+is fully type-annotated and free of dynamic tricks so it compiles
+unchanged with mypyc:
+
+    pip install mypy && mypyc scripts/_mdxcore.py
+
+The resulting C extension shadows this source file on import and
+removes the bytecode-dispatch overhead from the inner loops; without
+it, the plain-Python module is used and behaviour is identical.
+"""
+
+import io
+import re
+
+# Orphaned-code detection is plain character dispatch (Go-flavoured,
+# matching the language of most code blocks in the docs). These
+# predicates run on every line of every file — the innermost hot loop —
+# and startswith/slice tests are an order of magnitude cheaper than the
+# regex matchers they replaced. A single fused alternation with named
+# groups (one NFA setup per line instead of five) was measured as the
+# intermediate step, but the dispatch below beats it too: most lines
+# fail on the first one-character probe without entering the engine.
+_CODE_COMMENT_PREFIXES = ("//", "/*", "*/")
+_CODE_KEYWORDS = frozenset({"return", "defer", "go"})
+_MD_PREFIXES = ("#", ">", "|", "-", "!", "[", "*", "_")
+
+# JSX-escape patterns applied to prose lines only.
+_RE_LT_DIGIT = re.compile(r"(?<!\\)<(\d)")
+_RE_LT_CHAN = re.compile(r"(?<!\\)<-chan\b")
+_RE_LT_RECV = re.compile(r"(\s)<-(\s)")
+_RE_EMPTY_BRACES = re.compile(r"(?<!\\)\{\}")
+_RE_MERMAID_BRACE = re.compile(r"(?<!\\)\{(\w+)\}")
+_RE_HELM_OPEN = re.compile(r"(?<!\\)\{\{-?")
+_RE_HELM_CLOSE = re.compile(r"-?\}\}")
+
+# Accidental double escapes (left by earlier runs or by the Helm rule
+# matching an already-escaped brace) collapse in one pass covering all
+# three characters, instead of one full replace() scan per character.
+_RE_DOUBLE_ESC = re.compile(r"\\\\([{}<])")
+
+
+def is_code_continuation(line: str, stripped: str) -> bool:
+    """Report whether a line outside a fence looks like orphaned code.
+
+    The caller passes the already-stripped line: every call site has it
+    on hand, and stripping here again would re-scan and re-allocate the
+    string for each of the several probes per line.
+    """
+    if not stripped:
+        return False
+    if stripped.startswith(_CODE_COMMENT_PREFIXES):
+        return True
+    if stripped == "}":
+        return True
+    word, sep, _rest = stripped.partition(" ")
+    if sep and word in _CODE_KEYWORDS:
+        return True
+    if stripped.startswith("select") and stripped[6:].lstrip().startswith("{"):
+        return True
+    # Go short declaration: identifier followed by ':='.
+    first: str = stripped[0]
+    if first.isalpha() or first == "_":
+        i: int = 1
+        n: int = len(stripped)
+        while i < n and (stripped[i].isalnum() or stripped[i] == "_"):
+            i += 1
+        if stripped[i:].lstrip().startswith(":="):
+            return True
+    if line.startswith(("\t", "    ")):
+        return first not in "-*>"
+    return False
+
+
+def is_markdown_text(stripped: str) -> bool:
+    """Report whether a stripped line is markdown prose rather than code."""
+    if stripped.startswith(_MD_PREFIXES):
+        return True
+    # Numbered bold list item, e.g. "1. **First** step".
+    if stripped and stripped[0].isdigit():
+        head, sep, rest = stripped.partition(".")
+        return bool(sep) and head.isdigit() and rest.lstrip().startswith("**")
+    return False
+
+
+def fix_fragmented_blocks(content: str) -> str:
+    """Re-join code blocks that were split by a premature closing fence.
+
+    Export tooling sometimes closes a fence mid-block and re-opens it a
+    few lines later, leaving the lines in between rendered as prose. When
+    a line right after a bare closing fence still looks like code, the
+    fence is removed and the orphaned lines are pulled back into the
+    block.
+    """
+    lines: list[str] = content.split("\n")
+    # Strip each line exactly once up front. The main loop, the rewind
+    # scan, and the lookahead all consult the stripped form (previously
+    # 3-4 strip() calls per line, each a full scan plus an allocation);
+    # a parallel list of source indices lets the rewind reuse it too.
+    stripped: list[str] = [ln.strip() for ln in lines]
+    n: int = len(lines)
+    # Merging only ever removes lines (a premature fence costs at least
+    # as many lines as the one closing fence it is replaced with), so
+    # the output never outgrows the input: preallocate the full buffer
+    # and track a write pointer instead of paying append/resize churn.
+    result: list[str] = [""] * n
+    res_stripped: list[str] = [""] * n
+    idx: int = 0
+    in_code_block: bool = False
+    i: int = 0
+    while i < n:
+        line: str = lines[i]
+        line_stripped: str = stripped[i]
+        if line_stripped.startswith("```"):
+            in_code_block = not in_code_block
+            result[idx] = line
+            res_stripped[idx] = line_stripped
+            idx += 1
+            i += 1
+            continue
+        if (
+            not in_code_block
+            and line_stripped
+            and is_code_continuation(line, line_stripped)
+            and not is_markdown_text(line_stripped)
+        ):
+            k: int = idx - 1
+            while k >= 0 and not res_stripped[k]:
+                k -= 1
+            if k >= 0 and res_stripped[k] == "```":
+                # The fence closed too early: rewind over it (and the
+                # blank run after it) and absorb the orphaned code.
+                idx = k
+                result[idx] = line
+                res_stripped[idx] = line_stripped
+                idx += 1
+                i += 1
+                while i < n:
+                    nxt: str = lines[i]
+                    nxt_stripped: str = stripped[i]
+                    if nxt_stripped.startswith("```"):
+                        if nxt_stripped == "```":
+                            # Stray closing fence — we emit our own.
+                            i += 1
+                        break
+                    if not nxt_stripped:
+                        # Keep blank lines only when more code follows.
+                        j: int = i + 1
+                        while j < n and not stripped[j]:
+                            j += 1
+                        if (
+                            j < n
+                            and not stripped[j].startswith("```")
+                            and is_code_continuation(lines[j], stripped[j])
+                            and not is_markdown_text(stripped[j])
+                        ):
+                            result[idx] = nxt
+                            res_stripped[idx] = nxt_stripped
+                            idx += 1
+                            i += 1
+                            continue
+                        break
+                    if is_code_continuation(nxt, nxt_stripped) and not is_markdown_text(nxt_stripped):
+                        result[idx] = nxt
+                        res_stripped[idx] = nxt_stripped
+                        idx += 1
+                        i += 1
+                        continue
+                    break
+                result[idx] = "```"
+                res_stripped[idx] = "```"
+                idx += 1
+                continue
+        result[idx] = line
+        res_stripped[idx] = line_stripped
+        idx += 1
+        i += 1
+    return "\n".join(result[:idx])
+
+
+def transform_body(content: str) -> str:
+    """Fused pass: merge fragmented blocks and JSX-escape prose lines.
+
+    fix_fragmented_blocks and escape_jsx_patterns each walk the file
+    line by line tracking the same fence state; running them
+    back-to-back traverses (and reallocates) the whole line buffer
+    twice. This loop keeps one fence-state machine and applies the
+    fragment merge or the JSX escape per line as it is emitted, so a
+    file is split, walked, and joined exactly once.
+    """
+    lines: list[str] = content.split("\n")
+    stripped: list[str] = [ln.strip() for ln in lines]
+    n: int = len(lines)
+    result: list[str] = [""] * n
+    res_stripped: list[str] = [""] * n
+    idx: int = 0
+    in_code_block: bool = False
+    i: int = 0
+    while i < n:
+        line: str = lines[i]
+        line_stripped: str = stripped[i]
+        if line_stripped.startswith("```"):
+            in_code_block = not in_code_block
+            result[idx] = line
+            res_stripped[idx] = line_stripped
+            idx += 1
+            i += 1
+            continue
+        if (
+            not in_code_block
+            and line_stripped
+            and is_code_continuation(line, line_stripped)
+            and not is_markdown_text(line_stripped)
+        ):
+            k: int = idx - 1
+            while k >= 0 and not res_stripped[k]:
+                k -= 1
+            if k >= 0 and res_stripped[k] == "```":
+                # The fence closed too early: rewind over it (and the
+                # blank run after it) and absorb the orphaned code.
+                # Absorbed lines are code again, so none are escaped.
+                idx = k
+                result[idx] = line
+                res_stripped[idx] = line_stripped
+                idx += 1
+                i += 1
+                while i < n:
+                    nxt: str = lines[i]
+                    nxt_stripped: str = stripped[i]
+                    if nxt_stripped.startswith("```"):
+                        if nxt_stripped == "```":
+                            # Stray closing fence — we emit our own.
+                            i += 1
+                        break
+                    if not nxt_stripped:
+                        # Keep blank lines only when more code follows.
+                        j: int = i + 1
+                        while j < n and not stripped[j]:
+                            j += 1
+                        if (
+                            j < n
+                            and not stripped[j].startswith("```")
+                            and is_code_continuation(lines[j], stripped[j])
+                            and not is_markdown_text(stripped[j])
+                        ):
+                            result[idx] = nxt
+                            res_stripped[idx] = nxt_stripped
+                            idx += 1
+                            i += 1
+                            continue
+                        break
+                    if is_code_continuation(nxt, nxt_stripped) and not is_markdown_text(nxt_stripped):
+                        result[idx] = nxt
+                        res_stripped[idx] = nxt_stripped
+                        idx += 1
+                        i += 1
+                        continue
+                    break
+                result[idx] = "```"
+                res_stripped[idx] = "```"
+                idx += 1
+                continue
+        if not in_code_block and "`" not in line:
+            line = _escape_jsx_line(line)
+        result[idx] = line
+        res_stripped[idx] = line_stripped
+        idx += 1
+        i += 1
+    return "\n".join(result[:idx])
+
+
+def _escape_braces(match: "re.Match[str]") -> str:
+    return match.group(0).replace("{", r"\{").replace("}", r"\}")
+
+
+def _escape_mermaid(match: "re.Match[str]") -> str:
+    return r"\{" + match.group(1) + r"\}"
+
+
+def _escape_jsx_line(line: str) -> str:
+    """Apply every JSX escape rule to a single prose line."""
+    line = _RE_HELM_OPEN.sub(_escape_braces, line)
+    line = _RE_HELM_CLOSE.sub(_escape_braces, line)
+    line = _RE_EMPTY_BRACES.sub(_escape_braces, line)
+    line = _RE_MERMAID_BRACE.sub(_escape_mermaid, line)
+    line = _RE_LT_CHAN.sub(r"\\<-chan", line)
+    line = _RE_LT_RECV.sub(r"\1\\<-\2", line)
+    line = _RE_LT_DIGIT.sub(r"\\<\1", line)
+    if "\\\\" in line:
+        line = _RE_DOUBLE_ESC.sub(r"\\\1", line)
+    return line
+
+
+def escape_jsx_patterns(content: str) -> str:
+    """Escape JSX-significant characters on prose lines.
+
+    Fenced code is left alone, as are lines containing inline code spans
+    (escaping inside backticks would corrupt them). Files that also
+    need the fragment merge go through transform_body instead, which
+    applies these escapes in the same traversal.
+    """
+    # splitlines(keepends=True) + StringIO avoids the split/join
+    # round-trip: no second list of lines and no rebuilt string copy.
+    out = io.StringIO()
+    in_code_block: bool = False
+    for line in content.splitlines(keepends=True):
+        stripped: str = line.strip()
+        if stripped.startswith("```"):
+            in_code_block = not in_code_block
+            out.write(line)
+            continue
+        if not in_code_block and "`" not in line:
+            line = _escape_jsx_line(line)
+        out.write(line)
+    return out.getvalue()
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""Rewrite internal documentation links for the /docs URL prefix.
+
+The docs site moved all content under /docs/* (see
+docs/plans/2026-02-24-docs-url-prefix-plan.md). Exported markdown still
+carries root-relative links, godoc-style /pkg/ links, .md suffixes, and
+links to repo files that do not exist on the site. This script walks the
+content tree and rewrites every known stale link shape in place.
+
+Usage: fix-doc-links.py [docs-dir]   (defaults to ../docs)
+"""
+
+import collections
+import mmap
+import os
+import sys
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+
+_REPO_URL = "https://github.com/lookatitude/beluga-ai"
+_REPO_BLOB = _REPO_URL + "/blob/main/"
+
+# Content sections that moved under the /docs prefix.
+_CATEGORIES = (
+    "getting-started",
+    "guides",
+    "tutorials",
+    "api-reference",
+    "providers",
+    "architecture",
+    "integrations",
+    "contributing",
+    "cookbook",
+    "use-cases",
+    "reports",
+)
+
+# The 31 link-rewrite rules. They are fused below into a single master alternation so one
+# NFA traversal covers all of them, instead of 31 independent scans of
+# every file. Order matters: alternatives are tried left to right, which
+# preserves the old sequential priority.
+
+# Rules 1-11: root-relative section links gain the /docs prefix.
+# Each spec is (trigger literal, pattern source, replacement template);
+# the trigger is a plain substring that must be present for the rule to
+# possibly match, and feeds the multi-literal prefilter below.
+_LINK_RULE_SPECS = [
+    ("](/" + _cat + "/", r"\]\(/" + _cat + r"/", r"](/docs/" + _cat + "/")
+    for _cat in _CATEGORIES
+]
+
+_LINK_RULE_SPECS += [
+    # 12. godoc-style /pkg/ links now live under the API reference.
+    ("](/pkg/", r"\]\(/pkg/([^)]+)\)", r"](/docs/api-reference/\1)"),
+    # 13. /examples/ moved into the cookbook section.
+    ("](/examples/", r"\]\(/examples/([^)]+)\)", r"](/docs/cookbook/\1)"),
+    # 14. Bare /api/ index link.
+    ("](/api/)", r"\]\(/api/\)", r"](/docs/api-reference/)"),
+    # 15. The api-docs/ directory was renamed api-reference/ (its
+    #     packages/ subtree is handled separately below).
+    ("api-docs/", r"\]\(([^)]*?)api-docs/(?!packages/)", r"](\1api-reference/"),
+    # 16. Absolute site URLs that predate the /docs prefix.
+    (
+        "https://beluga-ai.org/",
+        r"\]\(https://beluga-ai\.org/(?!docs/)([^)]+)\)",
+        r"](https://beluga-ai.org/docs/\1)",
+    ),
+    # 17. Deep relative tutorials links that escape the content root.
+    ("../../../tutorials/", r"\]\(\.\./\.\./\.\./tutorials/([^)]+)\)", r"](/docs/tutorials/\1)"),
+    # 18. Same, one level shallower.
+    ("../../tutorials/", r"\]\(\.\./\.\./tutorials/([^)]+)\)", r"](/docs/tutorials/\1)"),
+    # 19. index.md links render as the directory URL.
+    ("/index.md)", r"\]\(([^)]*)/index\.md\)", r"](\1/)"),
+    # 20. .md + anchor inside absolute doc links.
+    (".md#", r"\]\((/docs/[^)#]+)\.md#([^)]+)\)", r"](\1/#\2)"),
+    # 21. .md suffix inside absolute doc links.
+    (".md)", r"\]\((/docs/[^)#]+)\.md\)", r"](\1/)"),
+    # 22. .md + anchor on relative links.
+    (".md#", r"\]\((\.{1,2}/[^)#]+)\.md#([^)]+)\)", r"](\1/#\2)"),
+    # 23. .md suffix on relative links.
+    (".md)", r"\]\((\.{1,2}/[^)#]+)\.md\)", r"](\1/)"),
+    # 24. Double slashes introduced by earlier rewrites.
+    ("](/docs/", r"\]\((/docs/[^)]*?)//", r"](\1/"),
+    # 25. Old /reference/ section is now /docs/api-reference/.
+    ("](/reference/", r"\]\(/reference/", r"](/docs/api-reference/"),
+    # 26. Old /how-to/ section merged into guides.
+    ("](/how-to/", r"\]\(/how-to/", r"](/docs/guides/"),
+    # 27. /quickstart moved under getting-started.
+    ("](/quickstart", r"\]\(/quickstart/?\)", r"](/docs/getting-started/quickstart/)"),
+    # 28. LICENSE links point at the repository.
+    ("LICENSE)", r"\]\((?:\.\./)*LICENSE\)", r"](" + _REPO_BLOB + "LICENSE)"),
+    # 29. docs/ links missing the leading slash.
+    ("](docs/", r"\]\(docs/", r"](/docs/"),
+    # 30. GitHub blob links to in-repo docs render on the site instead.
+    (
+        "blob/main/docs/",
+        r"\]\(https://github\.com/lookatitude/beluga-ai/blob/main/docs/([^)#]+)\.md\)",
+        r"](/docs/\1/)",
+    ),
+    # 31. Trailing .mdx suffixes behave like .md.
+    (".mdx)", r"\]\(([^)#]+)\.mdx\)", r"](\1/)"),
+]
+
+# One master regex: each rule becomes a named alternative r0..r30, and a
+# dispatch callback selects the replacement by which alternative
+# matched. Inner group numbers shift when the sources are concatenated,
+# so each handler resolves its rule's \N references relative to the
+# wrapper group's index.
+#
+# Every pattern here is pure ASCII, so the whole pipeline runs on bytes:
+# files are read with read_bytes and matched without ever paying the
+# UTF-8 decode/validate pass that read_text does on every byte.
+MASTER_PATTERN = re.compile(
+    "|".join(
+        f"(?P<r{_i}>{_src})"
+        for _i, (_trig, _src, _repl) in enumerate(_LINK_RULE_SPECS)
+    ).encode("ascii")
+)
+
+_REPL_REF = re.compile(rb"\\(\d)")
+
+
+def _make_handler(base, repl):
+    parts = _REPL_REF.split(repl.encode("ascii"))
+
+    def handler(match):
+        out = []
+        for j, part in enumerate(parts):
+            if j % 2:
+                out.append(match.group(base + int(part)) or b"")
+            else:
+                out.append(part)
+        return b"".join(out)
+
+    return handler
+
+
+_HANDLERS = {
+    f"r{_i}": _make_handler(MASTER_PATTERN.groupindex[f"r{_i}"], _repl)
+    for _i, (_trig, _src, _repl) in enumerate(_LINK_RULE_SPECS)
+}
+
+# Rules cascade (e.g. a section-prefix rewrite exposes a .md suffix for
+# the strip rule), so the master substitution is repeated until it stops
+# matching; in practice that is one or two extra passes, still far fewer
+# scans than one per rule.
+_MAX_MASTER_PASSES = 5
+
+# API packages whose generated pages were never migrated; links to them
+# fall back to the API reference index. One alternation instead of one
+# scan per package name.
+MISSING_API_DOCS = (
+    "messaging",
+    "documentloaders",
+    "safety",
+    "multimodal",
+    "textsplitters",
+)
+MISSING_API_PATTERN = re.compile(
+    rb"\]\([^)]*api-docs/packages/(?:"
+    + "|".join(MISSING_API_DOCS).encode("ascii")
+    + rb")\.md[^)]*\)"
+)
+
+# Literal substring rewrites that need no regex.
+PLAIN_RULES = [
+    (b"api-docs/packages/", b"api-reference/packages/"),
+    (b"/api/packages/", b"/docs/api-reference/packages/"),
+    (b"use-cases/batch-processing.md", b"use-cases/batch-inference.md"),
+]
+
+# Links to repo files that have no page on the site; point at GitHub.
+# One alternation covering all three files and all three relative
+# prefixes. This runs before the master alternation so the generic
+# .md-stripping rules never see them.
+REPO_FILE_PATTERN = re.compile(
+    rb"\]\((?:\./|\.\./|\.\./\.\./)(README|CONTRIBUTING|CHANGELOG)\.md\)"
+)
+REPO_FILE_REPL = b"](" + _REPO_BLOB.encode("ascii") + rb"\1.md)"
+
+# Pages three levels deep under integrations/ were written against the
+# old two-level layout; their upward relative links need one more level.
+INTEGRATION_DEPTH_RULES = [
+    (re.compile(rb"\]\(\.\./\.\./(?!\.\./)([a-z][a-z0-9-]*/)"), rb"](../../../\1"),
+]
+
+# Multi-literal prefilter: every rule group is keyed by the plain
+# substrings that must be present for it to fire. With pyahocorasick
+# installed, all triggers are found in ONE linear pass over the file
+# (O(N + matches) regardless of pattern count); without it, the
+# fallback probes each literal with a C-level containment scan, which
+# is still cheap but one pass per literal.
+_TRIGGER_TAGS = {}
+for _trig, _src, _repl in _LINK_RULE_SPECS:
+    _TRIGGER_TAGS.setdefault(_trig, "master")
+for _name in ("README.md", "CONTRIBUTING.md", "CHANGELOG.md"):
+    _TRIGGER_TAGS[_name] = "repo"
+_TRIGGER_TAGS["api-docs/packages/"] = "missing"
+_ALL_TAGS = frozenset(_TRIGGER_TAGS.values())
+
+try:
+    import ahocorasick
+except ImportError:  # optional dependency; the fallback scan is fine
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _lit, _tag in _TRIGGER_TAGS.items():
+        _AUTOMATON.add_word(_lit, _tag)
+    _AUTOMATON.make_automaton()
+else:
+    _AUTOMATON = None
+
+_TRIGGER_ITEMS = tuple(
+    (_lit.encode("ascii"), _tag) for _lit, _tag in _TRIGGER_TAGS.items()
+)
+
+
+def _trigger_hits(content):
+    """Return the set of rule-group tags whose trigger occurs in content."""
+    hits = set()
+    if _AUTOMATON is not None:
+        # latin-1 is a 1:1 byte mapping, so the decode is a cheap copy
+        # and ASCII trigger positions are preserved.
+        for _, tag in _AUTOMATON.iter(content.decode("latin-1")):
+            hits.add(tag)
+            if len(hits) == len(_ALL_TAGS):
+                break
+        return hits
+    for lit, tag in _TRIGGER_ITEMS:
+        if tag not in hits and lit in content:
+            hits.add(tag)
+    return hits
+
+
+def apply_link_rules(content, rel_path=None, depth=0):
+    """Apply every rewrite rule to a bytes body; returns (content, changes)."""
+    local_changes = 0
+
+    # Every rule rewrites a markdown link target, so a file without "]("
+    # cannot match anything: one C-level substring probe skips all the
+    # regex work. The finer-grained gates below do the same for rule
+    # groups whose trigger literal is rarely present.
+    if b"](" not in content:
+        return content, local_changes
+
+    # One trigger scan decides which rule groups can fire at all; files
+    # with links but no stale shapes (the majority) skip every regex.
+    hits = _trigger_hits(content)
+
+    # subn replaces the search-then-sub pair everywhere below: one scan
+    # per pattern instead of two, and the match count comes for free.
+    # Tuple membership on parts, not substring search on str(rel_path):
+    # no path-to-string materialisation per file.
+    if rel_path is not None and depth >= 3 and "integrations" in rel_path.parts:
+        for pattern, repl in INTEGRATION_DEPTH_RULES:
+            content, n = pattern.subn(repl, content)
+            if n:
+                local_changes += 1
+
+    if "repo" in hits:
+        content, n = REPO_FILE_PATTERN.subn(REPO_FILE_REPL, content)
+        if n:
+            local_changes += 1
+
+    if "missing" in hits:
+        content, n = MISSING_API_PATTERN.subn(b"](/docs/api-reference/)", content)
+        if n:
+            local_changes += 1
+
+    for literal, replacement in PLAIN_RULES:
+        new_content = content.replace(literal, replacement)
+        if new_content != content:
+            content = new_content
+            local_changes += 1
+
+    if "master" in hits or local_changes:
+        fired = set()
+
+        def _dispatch(match):
+            name = match.lastgroup
+            fired.add(name)
+            return _HANDLERS[name](match)
+
+        for _ in range(_MAX_MASTER_PASSES):
+            content, n = MASTER_PATTERN.subn(_dispatch, content)
+            if not n:
+                break
+        local_changes += len(fired)
+
+    return content, local_changes
+
+
+def fix_file(file_path, rel_path=None, depth=0):
+    """Rewrite one file; returns (rules fired, log message or None).
+
+    Counters and log lines are aggregated by the caller from the return
+    value — module globals would not survive the trip through worker
+    processes, and printing here would interleave output from the pool
+    workers while paying a stdout lock/flush per file.
+    """
+    # For the common "nothing to rewrite" case, avoid copying the file
+    # into the Python heap at all: mmap the file and run the cheap link
+    # probe against the kernel's page cache. Only a hit materialises the
+    # content as a bytes object for the rewrite path.
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            return 0, None
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            if mm.find(b"](") == -1:
+                return 0, None
+            content = mm[:]
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+    original = content
+    # The caller walks the tree and already knows where each file sits;
+    # recomputing relative_to/depth here per file is redundant pathlib
+    # work, so both arrive precomputed (with a fallback for direct
+    # single-file use).
+    if rel_path is None:
+        rel_path = file_path.relative_to(DOCS_DIR)
+        depth = len(rel_path.parts) - 1
+    content, local_changes = apply_link_rules(content, rel_path, depth)
+    # Rules can cancel out (a rewrite later reversed), so gate the write
+    # on the final bytes, not on the rule counter. The comparison
+    # short-circuits on the first differing byte. Writing through a raw
+    # fd skips pathlib's open/TextIOWrapper layering.
+    if content != original:
+        fd = os.open(file_path, os.O_WRONLY | os.O_TRUNC)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+        return local_changes, f"Fixed: {rel_path} ({local_changes} changes)"
+    return 0, None
+
+
+def _iter_tasks():
+    """Yield (path, rel_path, depth) lazily while the tree is walked.
+
+    rglob is a generator, so no path list is ever materialised; the
+    classification fix_file needs is computed inline. Ordering follows
+    the directory walk — the old sorted() pass was cosmetic for logs
+    and required holding every path in memory first.
+    """
+    for path in DOCS_DIR.rglob("*.md"):
+        rel = path.relative_to(DOCS_DIR)
+        yield path, rel, len(rel.parts) - 1
+
+
+def main(argv):
+    global DOCS_DIR
+    if argv[1:]:
+        DOCS_DIR = Path(argv[1]).resolve()
+    changes_made = 0
+    files_modified = 0
+    # Workers return their log line instead of printing it: one
+    # buffered stdout write at the end replaces a lock/encode/flush per
+    # modified file and keeps pool output from interleaving.
+    messages = []
+
+    def _collect(result):
+        nonlocal changes_made, files_modified
+        n, message = result
+        if n:
+            changes_made += n
+            files_modified += 1
+            messages.append(message)
+
+    # Independent files + CPU-bound regex work: fan out across
+    # processes (the GIL rules out threads for this shape).
+    # Executor.map would drain the generator up front to submit
+    # everything, so submission is windowed by hand: directory traversal
+    # overlaps the rewrite work and in-flight state stays O(pool size)
+    # however large the tree is.
+    with ProcessPoolExecutor() as executor:
+        window = (os.cpu_count() or 1) * 4
+        pending = collections.deque()
+        for task in _iter_tasks():
+            pending.append(executor.submit(fix_file, *task))
+            if len(pending) >= window:
+                _collect(pending.popleft().result())
+        while pending:
+            _collect(pending.popleft().result())
+    messages.append(f"Done: {changes_made} changes across {files_modified} files")
+    sys.stdout.write("\n".join(messages) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,130 @@
+"""Tests for fix-doc-links.py. Run with: python3 -m unittest discover scripts"""
+
+import importlib.util
+import pathlib
+import tempfile
+import unittest
+
+_SPEC = importlib.util.spec_from_file_location(
+    "fix_doc_links", pathlib.Path(__file__).parent / "fix-doc-links.py"
+)
+fix_doc_links = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(fix_doc_links)
+
+
+class TestApplyLinkRules(unittest.TestCase):
+    def _apply(self, content, rel_path=None, depth=0):
+        # apply_link_rules works on bytes (the patterns are all ASCII);
+        # the test table stays readable as str.
+        got, n = fix_doc_links.apply_link_rules(content.encode(), rel_path, depth)
+        return got.decode(), n
+
+    def test_table(self):
+        cases = [
+            ("section_prefix", "[g](/guides/streaming/)", "[g](/docs/guides/streaming/)"),
+            ("pkg_link", "[c](/pkg/core)", "[c](/docs/api-reference/core)"),
+            ("examples", "[e](/examples/chat/)", "[e](/docs/cookbook/chat/)"),
+            ("bare_api", "[a](/api/)", "[a](/docs/api-reference/)"),
+            (
+                "api_packages",
+                "[m](/api/packages/memory.md)",
+                "[m](/docs/api-reference/packages/memory/)",
+            ),
+            (
+                "api_docs_rename",
+                "[x](../api-docs/intro.md)",
+                "[x](../api-reference/intro/)",
+            ),
+            (
+                "missing_api_doc",
+                "[s](../api-docs/packages/safety.md)",
+                "[s](/docs/api-reference/)",
+            ),
+            (
+                "site_url_prefix",
+                "[u](https://beluga-ai.org/guides/x/)",
+                "[u](https://beluga-ai.org/docs/guides/x/)",
+            ),
+            (
+                "deep_tutorials",
+                "[t](../../../tutorials/agents.md)",
+                "[t](/docs/tutorials/agents/)",
+            ),
+            ("index_md", "[i](/docs/guides/index.md)", "[i](/docs/guides/)"),
+            (
+                "md_anchor",
+                "[a](/docs/guides/x.md#setup)",
+                "[a](/docs/guides/x/#setup)",
+            ),
+            ("relative_md", "[r](./sibling.md)", "[r](./sibling/)"),
+            (
+                "readme_to_github",
+                "[r](../README.md)",
+                "[r](https://github.com/lookatitude/beluga-ai/blob/main/README.md)",
+            ),
+            (
+                "contributing_to_github",
+                "[c](./CONTRIBUTING.md)",
+                "[c](https://github.com/lookatitude/beluga-ai/blob/main/CONTRIBUTING.md)",
+            ),
+            (
+                "license",
+                "[l](../../LICENSE)",
+                "[l](https://github.com/lookatitude/beluga-ai/blob/main/LICENSE)",
+            ),
+            (
+                "batch_processing_rename",
+                "[b](/use-cases/batch-processing.md)",
+                "[b](/docs/use-cases/batch-inference/)",
+            ),
+            ("reference_section", "[r](/reference/llm/)", "[r](/docs/api-reference/llm/)"),
+            ("how_to", "[h](/how-to/deploy/)", "[h](/docs/guides/deploy/)"),
+            ("quickstart", "[q](/quickstart)", "[q](/docs/getting-started/quickstart/)"),
+            ("missing_slash", "[d](docs/guides/x/)", "[d](/docs/guides/x/)"),
+            ("clean", "[ok](/docs/guides/x/) and prose", None),
+        ]
+        for name, src, want in cases:
+            with self.subTest(name):
+                got, n = self._apply(src)
+                if want is None:
+                    self.assertEqual(got, src)
+                    self.assertEqual(n, 0)
+                else:
+                    self.assertEqual(got, want)
+                    self.assertGreater(n, 0)
+
+    def test_integration_depth(self):
+        rel = pathlib.Path("integrations/llm/openai.md")
+        got, n = self._apply("[g](../../guides/x.md)", rel, depth=3)
+        self.assertEqual(got, "[g](../../../guides/x/)")
+        self.assertGreater(n, 0)
+        # Shallow pages keep their links.
+        got, _ = self._apply("[g](../../guides/x.md)", pathlib.Path("guides/a/x.md"), 2)
+        self.assertEqual(got, "[g](../../guides/x/)")
+
+
+class TestFixFile(unittest.TestCase):
+    def test_end_to_end(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            sub = root / "guides"
+            sub.mkdir()
+            page = sub / "page.md"
+            page.write_text(
+                "[a](/guides/streaming/) and [b](./other.md)\n", encoding="utf-8"
+            )
+            old_dir = fix_doc_links.DOCS_DIR
+            fix_doc_links.DOCS_DIR = root
+            try:
+                n, message = fix_doc_links.fix_file(page)
+            finally:
+                fix_doc_links.DOCS_DIR = old_dir
+            self.assertGreater(n, 0)
+            self.assertIn("Fixed:", message)
+            fixed = page.read_text(encoding="utf-8")
+            self.assertIn("(/docs/guides/streaming/)", fixed)
+            self.assertIn("(./other/)", fixed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+"""Tests for fix_mdx.py. Run with: python3 -m unittest discover scripts"""
+
+import os
+import tempfile
+import unittest
+
+import fix_mdx
+
+
+class TestDecodeHTMLEntities(unittest.TestCase):
+    def test_table(self):
+        cases = [
+            ("named", "a &lt;b&gt; &amp; c", 'a <b> & c'),
+            ("quotes", "&quot;x&quot; &#39;y&#39;", "\"x\" 'y'"),
+            ("brackets", "&#91;link&#93; &#123;x&#125;", "[link] {x}"),
+            ("numeric", "arrow &#8594; here", "arrow → here"),
+            ("untouched", "plain text", "plain text"),
+        ]
+        for name, src, want in cases:
+            with self.subTest(name):
+                self.assertEqual(fix_mdx.decode_html_entities(src), want)
+
+
+class TestPredicates(unittest.TestCase):
+    def test_is_code_continuation(self):
+        cases = [
+            ("comment", "// note", True),
+            ("close_brace", "}", True),
+            ("return", "return err", True),
+            ("defer", "defer cancel()", True),
+            ("short_decl", "x := 1", True),
+            ("select", "select {", True),
+            ("indented_code", "\tfmt.Println(x)", True),
+            ("indented_bullet", "    - item", False),
+            ("indented_quote", "    > note", False),
+            ("prose", "Some text here.", False),
+            ("heading", "# Title", False),
+            ("block_comment", "/* start", True),
+            ("go_keyword", "go worker()", True),
+            ("decl_spaced", "total  := sum(xs)", True),
+            ("returnish_word", "returning soon.", False),
+            ("empty", "", False),
+        ]
+        for name, line, want in cases:
+            with self.subTest(name):
+                self.assertEqual(
+                    fix_mdx.is_code_continuation(line, line.strip()), want
+                )
+
+    def test_is_markdown_text(self):
+        cases = [
+            ("heading", "# Title", True),
+            ("quote", "> quoted", True),
+            ("bullet", "- item", True),
+            ("numbered_bold", "1. **First** step", True),
+            ("numbered_plain", "1. plain step", False),
+            ("code_line", "x := 1", False),
+            ("prose", "Plain sentence.", False),
+        ]
+        for name, line, want in cases:
+            with self.subTest(name):
+                self.assertEqual(fix_mdx.is_markdown_text(line.strip()), want)
+
+
+class TestFixFragmentedBlocks(unittest.TestCase):
+    def test_merges_orphaned_code(self):
+        src = "\n".join([
+            "```go",
+            "func main() {",
+            "\tx := 1",
+            "```",
+            "\treturn x",
+            "}",
+            "",
+            "Some text.",
+        ])
+        want = "\n".join([
+            "```go",
+            "func main() {",
+            "\tx := 1",
+            "\treturn x",
+            "}",
+            "```",
+            "",
+            "Some text.",
+        ])
+        self.assertEqual(fix_mdx.fix_fragmented_blocks(src), want)
+
+    def test_consumes_stray_closing_fence(self):
+        src = "\n".join([
+            "```go",
+            "a := 1",
+            "```",
+            "b := 2",
+            "```",
+            "",
+            "Prose after.",
+        ])
+        want = "\n".join([
+            "```go",
+            "a := 1",
+            "b := 2",
+            "```",
+            "",
+            "Prose after.",
+        ])
+        self.assertEqual(fix_mdx.fix_fragmented_blocks(src), want)
+
+    def test_leaves_proper_blocks_alone(self):
+        src = "\n".join([
+            "Intro.",
+            "",
+            "```go",
+            "x := 1",
+            "```",
+            "",
+            "Outro.",
+        ])
+        self.assertEqual(fix_mdx.fix_fragmented_blocks(src), src)
+
+
+class TestRemoveEmptyCodeBlocks(unittest.TestCase):
+    def test_table(self):
+        cases = [
+            ("with_lang", "```go\n```\nafter", "after"),
+            ("blank_interior", "```\n\n```\nafter", "after"),
+            ("kept", "```go\nx := 1\n```\n", "```go\nx := 1\n```\n"),
+        ]
+        for name, src, want in cases:
+            with self.subTest(name):
+                self.assertEqual(fix_mdx.remove_empty_code_blocks(src), want)
+
+
+class TestEscapeJSXPatterns(unittest.TestCase):
+    def test_table(self):
+        cases = [
+            ("lt_digit", "supports <5 retries", r"supports \<5 retries"),
+            ("lt_chan", "a <-chan value", r"a \<-chan value"),
+            ("lt_recv", "then x <- y runs", r"then x \<- y runs"),
+            ("empty_braces", "pass {} here", r"pass \{\} here"),
+            ("placeholder", "set {name} first", r"set \{name\} first"),
+            ("helm", "uses {{- .Values.x -}} syntax",
+             r"uses \{\{- .Values.x -\}\} syntax"),
+            ("inline_code_skipped", "use `{}` here", "use `{}` here"),
+        ]
+        for name, src, want in cases:
+            with self.subTest(name):
+                self.assertEqual(fix_mdx.escape_jsx_patterns(src), want)
+
+    def test_code_fences_untouched(self):
+        src = "\n".join([
+            "```go",
+            "ch := make(chan int)",
+            "m := map[string]int{}",
+            "```",
+        ])
+        self.assertEqual(fix_mdx.escape_jsx_patterns(src), src)
+
+    def test_idempotent(self):
+        src = "set {name} and <5 and {} done"
+        once = fix_mdx.escape_jsx_patterns(src)
+        self.assertEqual(fix_mdx.escape_jsx_patterns(once), once)
+
+
+class TestTransformBody(unittest.TestCase):
+    def test_merges_and_escapes_in_one_pass(self):
+        src = "\n".join([
+            "Set {name} before running.",
+            "",
+            "```go",
+            "x := map[string]int{}",
+            "```",
+            "return x",
+            "",
+            "Done with <5 retries.",
+        ])
+        want = "\n".join([
+            r"Set \{name\} before running.",
+            "",
+            "```go",
+            "x := map[string]int{}",
+            "return x",
+            "```",
+            "",
+            r"Done with \<5 retries.",
+        ])
+        self.assertEqual(fix_mdx.transform_body(src), want)
+
+
+class TestFixMarkdownFile(unittest.TestCase):
+    def test_end_to_end(self):
+        src = "\n".join([
+            "# Title",
+            "",
+            "Text with &lt;angle&gt; and {placeholder}.",
+            "",
+            "```go",
+            "```",
+            "Done.",
+        ])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "page.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(src)
+            self.assertTrue(fix_mdx.fix_markdown_file(path))
+            with open(path, encoding="utf-8") as f:
+                fixed = f.read()
+            self.assertIn("<angle>", fixed)
+            self.assertIn(r"\{placeholder\}", fixed)
+            self.assertNotIn("```go\n```", fixed)
+            # A second run must be a no-op.
+            self.assertFalse(fix_mdx.fix_markdown_file(path))
+
+
+class TestProcessPath(unittest.TestCase):
+    def test_cache_skips_unchanged_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "page.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("Text with &lt;angle&gt; here.\n")
+            fixed, total = fix_mdx.process_path(tmp)
+            self.assertEqual((fixed, total), (1, 1))
+            self.assertTrue(os.path.exists(os.path.join(tmp, fix_mdx.CACHE_FILE)))
+            # Warm run: the file is unchanged, so nothing is reprocessed.
+            fixed, total = fix_mdx.process_path(tmp)
+            self.assertEqual((fixed, total), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()